@@ -36,7 +36,7 @@ def cmd_run(args) -> None:
     drain_jobs(cfg)
 
     # Start watcher
-    watch(cfg)
+    watch(cfg, poll=args.poll)
 
 
 def _prompt(label: str, default: str) -> str:
@@ -129,6 +129,10 @@ def _run_setup(defaults: dict) -> None:
         f'vault_path = "{vault_path}"',
         f"timeout = {timeout_int}",
     ]
+    # Advanced settings aren't prompted for, but survive a reconfigure
+    for key in ("max_parallel", "marker_delay"):
+        if key in defaults:
+            config_lines.append(f"{key} = {defaults[key]}")
     if allowed_paths:
         paths_toml = ", ".join(f'"{p}"' for p in allowed_paths)
         config_lines.append(f"allowed_paths = [{paths_toml}]")
@@ -194,6 +198,14 @@ def main() -> None:
     run_parser.add_argument(
         "--timeout", type=int, default=None, help="Claude CLI timeout in seconds"
     )
+    run_parser.add_argument(
+        "--max-parallel", type=int, default=None,
+        help="Max number of jobs to run at once (default: 1)",
+    )
+    run_parser.add_argument(
+        "--poll", action="store_true",
+        help="Poll Jobs/ instead of using native file events (e.g. network filesystems)",
+    )
 
     # familiar init
     subparsers.add_parser("init", help="Create config file and vault directories")
@@ -1,5 +1,6 @@
 """Configuration loading and defaults for Familiar."""
 
+import os
 import tomllib
 from dataclasses import dataclass
 from pathlib import Path
@@ -17,6 +18,8 @@ class FamiliarConfig:
     vault_root: Path = Path("~/Obsidian")
     timeout: int = 300
     allowed_paths: list[str] = None
+    max_parallel: int = 1
+    marker_delay: float = 30
 
     def __post_init__(self):
         self.vault_path = Path(self.vault_path).expanduser().resolve()
@@ -26,14 +29,32 @@ class FamiliarConfig:
         self.allowed_paths = [
             str(Path(p).expanduser().resolve()) for p in self.allowed_paths
         ]
+        self.max_parallel = max(1, int(self.max_parallel))
+        self.marker_delay = float(self.marker_delay)
+
+
+# Last parsed config, keyed on (path, mtime_ns, size) of config.toml
+_CONFIG_CACHE: dict[tuple, dict] = {}
 
 
 def load_config() -> dict:
-    """Read config.toml and return raw dict. Returns empty dict if missing."""
-    if not CONFIG_PATH.exists():
+    """Read config.toml and return raw dict. Returns empty dict if missing.
+
+    The parsed dict is cached until the file changes; callers must not mutate it.
+    """
+    try:
+        st = os.stat(CONFIG_PATH)
+    except FileNotFoundError:
         return {}
+    key = (CONFIG_PATH, st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None:
+        return cached
     with open(CONFIG_PATH, "rb") as f:
-        return tomllib.load(f)
+        cfg = tomllib.load(f)
+    _CONFIG_CACHE.clear()
+    _CONFIG_CACHE[key] = cfg
+    return cfg
 
 
 def resolve_config(cli_args) -> FamiliarConfig:
@@ -45,6 +66,8 @@ def resolve_config(cli_args) -> FamiliarConfig:
     vault_root = file_cfg.get("vault_root", "~/Obsidian")
     timeout = file_cfg.get("timeout", 300)
     allowed_paths = file_cfg.get("allowed_paths", [])
+    max_parallel = file_cfg.get("max_parallel", 1)
+    marker_delay = file_cfg.get("marker_delay", 30)
 
     if getattr(cli_args, "name", None) is not None:
         name = cli_args.name
@@ -54,6 +77,8 @@ def resolve_config(cli_args) -> FamiliarConfig:
         vault_root = str(cli_args.vault_root)
     if getattr(cli_args, "timeout", None) is not None:
         timeout = cli_args.timeout
+    if getattr(cli_args, "max_parallel", None) is not None:
+        max_parallel = cli_args.max_parallel
 
     return FamiliarConfig(
         name=name,
@@ -61,4 +86,6 @@ def resolve_config(cli_args) -> FamiliarConfig:
         vault_root=Path(vault_root),
         timeout=timeout,
         allowed_paths=allowed_paths,
+        max_parallel=max_parallel,
+        marker_delay=marker_delay,
     )
@@ -1,25 +1,61 @@
 """Core processing: frontmatter, file lifecycle, Claude invocation."""
 
+import contextlib
+import functools
+import io
+import os
 import shutil
 import subprocess
 import sys
+import tempfile
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 
 from .config import FamiliarConfig
 
+try:
+    import yaml
+except ImportError:  # optional dependency: pip install familiar[yaml]
+    yaml = None
+else:
+    # LibYAML's C loader when available, pure-Python otherwise
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# Serializes stdout writes from concurrent jobs and their spinners
+_OUTPUT_LOCK = threading.Lock()
+
+CLEAR_LINE = "\r" + " " * 80 + "\r"
+
+# Bytes of Claude CLI stderr kept for error reports
+STDERR_TAIL = 64 * 1024
+
 
 def log(name: str, msg: str) -> None:
     ts = datetime.now().strftime("%H:%M:%S")
-    print(f"[{ts}] [{name}] {msg}", flush=True)
+    with _OUTPUT_LOCK:
+        if Spinner.active:
+            # Start on a clean line rather than after a running spinner
+            sys.stdout.write(CLEAR_LINE)
+        print(f"[{ts}] [{name}] {msg}", flush=True)
 
 
 class Spinner:
-    """Animated spinner with elapsed time for long-running operations."""
+    """Animated spinner with elapsed time for long-running operations.
+
+    Only draws when stdout is a terminal; under a service manager or with
+    output redirected to a log it does nothing.
+    """
 
     FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+    INTERVAL = 0.25
+
+    # Number of spinners running; with max_parallel > 1 they take turns
+    # drawing on the same line
+    active = 0
 
     def __init__(self, name: str, message: str):
         self.name = name
@@ -29,34 +65,64 @@ class Spinner:
 
     def _spin(self):
         start = time.monotonic()
+        # Stamped with the start time; the elapsed counter shows progress
+        prefix = f"\r[{datetime.now().strftime('%H:%M:%S')}] [{self.name}]"
         i = 0
         while not self._stop.is_set():
             elapsed = int(time.monotonic() - start)
             m, s = divmod(elapsed, 60)
             frame = self.FRAMES[i % len(self.FRAMES)]
-            ts = datetime.now().strftime("%H:%M:%S")
-            line = f"\r[{ts}] [{self.name}] {frame} {self.message} ({m}:{s:02d})"
-            sys.stdout.write(line)
-            sys.stdout.flush()
+            line = f"{prefix} {frame} {self.message} ({m}:{s:02d})"
+            with _OUTPUT_LOCK:
+                sys.stdout.write(line)
+                sys.stdout.flush()
             i += 1
-            self._stop.wait(0.1)
+            self._stop.wait(self.INTERVAL)
         # Clear the spinner line
-        sys.stdout.write("\r" + " " * 80 + "\r")
-        sys.stdout.flush()
+        with _OUTPUT_LOCK:
+            sys.stdout.write(CLEAR_LINE)
+            sys.stdout.flush()
 
     def __enter__(self):
+        if not sys.stdout.isatty():
+            return self
+        with _OUTPUT_LOCK:
+            Spinner.active += 1
         self._thread = threading.Thread(target=self._spin, daemon=True)
         self._thread.start()
         return self
 
     def __exit__(self, *args):
+        if self._thread is None:
+            return
         self._stop.set()
         self._thread.join()
+        with _OUTPUT_LOCK:
+            Spinner.active -= 1
+
+
+# Bases whose subdirectories were already created by this process
+_ENSURED: set[Path] = set()
 
 
 def ensure_dirs(base: Path) -> None:
+    if base in _ENSURED:
+        return
     for dirname in ("Jobs", "Processing", "Done", "Failed"):
         (base / dirname).mkdir(parents=True, exist_ok=True)
+    _ENSURED.add(base)
+
+
+class _Frontmatter(dict):
+    """Frontmatter values, plus each top-level field's source as (value, text).
+
+    serialize_frontmatter writes fields whose value is unchanged back exactly
+    as found, so only the keys Familiar updates are ever reformatted.
+    """
+
+    def __init__(self, values: dict, source: dict[str, tuple]):
+        super().__init__(values)
+        self.source = source
 
 
 def parse_frontmatter(content: str) -> tuple[dict, str]:
@@ -67,25 +133,67 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
     if end == -1:
         return {}, content
     raw = content[3:end].strip()
-    meta = {}
-    for line in raw.splitlines():
-        if ":" in line:
-            key, _, val = line.partition(":")
-            val = val.strip()
-            if val.isdigit():
-                val = int(val)
-            meta[key.strip()] = val
+    values, source = _load_meta(raw)
+    # Copies values, so callers can update the metadata without touching the cache
+    meta = _Frontmatter(values, source)
     body = content[end + 3 :].lstrip("\n")
     return meta, body
 
 
+def _split_fields(raw: str) -> dict[str, str]:
+    """Split a frontmatter block into the source lines of each top-level key.
+
+    Indented lines, list items and comments belong to the key above them.
+    """
+    fields: dict[str, str] = {}
+    key = None
+    for line in raw.splitlines(keepends=True):
+        if line[:1] not in ("", " ", "\t", "-", "#") and ":" in line:
+            key = line.partition(":")[0].strip()
+            fields[key] = line
+        elif key is not None:
+            fields[key] += line
+    return {k: text if text.endswith("\n") else text + "\n" for k, text in fields.items()}
+
+
+@functools.lru_cache(maxsize=1024)
+def _load_meta(raw: str) -> tuple[dict, dict[str, tuple]]:
+    """Load a frontmatter block, with PyYAML if installed.
+
+    Returns (values, source), source mapping each key to (value, text).
+    """
+    fields = _split_fields(raw)
+    meta = None
+    if yaml is not None:
+        try:
+            meta = yaml.load(raw, Loader=_YAML_LOADER)
+        except yaml.YAMLError:
+            meta = None
+        if meta is None and not raw:
+            meta = {}
+    if not isinstance(meta, dict):
+        # Fallback: flat "key: value" lines, digits as ints
+        meta = {}
+        for key, text in fields.items():
+            val = text.splitlines()[0].partition(":")[2].strip()
+            if val.isdigit():
+                val = int(val)
+            meta[key] = val
+    source = {k: (meta[k], text) for k, text in fields.items() if k in meta}
+    return meta, source
+
+
+def _field(key, value, source: dict[str, tuple]) -> str:
+    orig = source.get(key)
+    if orig is not None and type(orig[0]) is type(value) and orig[0] == value:
+        return orig[1]
+    return f"{key}: {value}\n"
+
+
 def serialize_frontmatter(meta: dict, body: str) -> str:
-    lines = ["---"]
-    for k, v in meta.items():
-        lines.append(f"{k}: {v}")
-    lines.append("---")
-    lines.append("")
-    return "\n".join(lines) + body
+    source = getattr(meta, "source", {})
+    fields = "".join(_field(k, v, source) for k, v in meta.items())
+    return f"---\n{fields}---\n{body}"
 
 
 def unique_dest(dest: Path) -> Path:
@@ -103,17 +211,206 @@ def unique_dest(dest: Path) -> Path:
         i += 1
 
 
-def _run_block(name: str, iteration: int, content: str) -> str:
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M")
+# Serializes picking a free name and moving onto it, so concurrent jobs
+# can't claim the same destination
+_MOVE_LOCK = threading.Lock()
+
+
+def _move_unique(src: Path, dest: Path) -> Path:
+    """Move src to dest, or to a suffixed name if dest is taken. Returns the path used."""
+    with _MOVE_LOCK:
+        dest = unique_dest(dest)
+        shutil.move(str(src), str(dest))
+    return dest
+
+
+def _run_block(name: str, iteration: int, content: str, at: datetime) -> str:
+    ts = at.strftime("%Y-%m-%d %H:%M")
     # Indent every line of content for the callout block
     indented = "\n".join(f"> {line}" if line else ">" for line in content.splitlines())
     return f"\n\n> [!quote] {name} — Report {iteration} at {ts}\n{indented}\n"
 
 
-def build_prompt(cfg: FamiliarConfig, meta: dict, body: str) -> str:
-    parts = []
+def _write_run_block(f, name: str, iteration: int, lines, at: datetime) -> None:
+    """Stream lines into f as a callout block.
+
+    Writes the same text as _run_block(name, iteration, "".join(lines).strip(), at)
+    without holding the whole output in memory.
+    """
+    ts = at.strftime("%Y-%m-%d %H:%M")
+    f.write(f"\n\n> [!quote] {name} — Report {iteration} at {ts}\n")
+    # Hold back the last non-blank line and any blanks after it, since
+    # trailing whitespace is stripped
+    pending: list[str] = []
+    wrote = False
+    for line in lines:
+        line = line.rstrip("\n")
+        if not wrote and not pending:
+            line = line.lstrip()
+            if not line:
+                continue
+        if line.strip():
+            for held in pending:
+                f.write(f"> {held}\n" if held else ">\n")
+            pending = [line]
+            wrote = True
+        else:
+            pending.append(line)
+    if pending:
+        f.write(f"> {pending[0].rstrip()}\n")
+    else:
+        f.write("\n")
+
+
+@contextlib.contextmanager
+def _atomic_open(path: Path):
+    """Open a hidden temp file beside path for writing, then swap it into place.
+
+    The temp file is removed if writing fails, and path is left untouched.
+    """
+    tmp = tempfile.NamedTemporaryFile(
+        "w", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    )
+    try:
+        with tmp:
+            # Keep the note's permissions rather than the temp file's 0600
+            with contextlib.suppress(FileNotFoundError):
+                shutil.copymode(path, tmp.name)
+            yield tmp
+        os.replace(tmp.name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp.name)
+        raise
+
+
+def _write_text(path: Path, text: str) -> None:
+    with _atomic_open(path) as f:
+        f.write(text)
+
+
+@contextlib.contextmanager
+def _delayed_write(delay: float, path: Path, text: str):
+    """Write text to path if the block is still running after delay seconds."""
+    timer = threading.Timer(delay, _write_text, args=(path, text))
+    timer.start()
+    try:
+        yield
+    finally:
+        timer.cancel()
+        timer.join()
+
+
+def _pump(src, dst) -> None:
+    """Copy src into dst until EOF, stopping quietly if dst is closed first."""
+    try:
+        shutil.copyfileobj(src, dst, 65536)
+    except (OSError, ValueError):
+        pass
+
+
+def _tail(src, buf: bytearray, limit: int) -> None:
+    """Read src until EOF, keeping only its last limit bytes in buf."""
+    while chunk := src.read1(65536):
+        buf += chunk
+        if len(buf) > limit:
+            del buf[:-limit]
+
+
+def _feed(dst, data: bytes) -> None:
+    """Write data to dst and close it, stopping quietly if the reader has gone."""
+    try:
+        dst.write(data)
+        dst.close()
+    except (OSError, ValueError):
+        pass
+
+
+# Claude processes currently running, so shutdown_jobs can stop them
+_PROCS: set[subprocess.Popen] = set()
+_PROCS_LOCK = threading.Lock()
+_STOPPING = threading.Event()
+
+
+class _Interrupted(Exception):
+    """The Claude CLI was killed because Familiar is shutting down."""
+
+
+def _run_claude(cfg: FamiliarConfig, prompt: str, out) -> tuple[int, str]:
+    """Run the Claude CLI, streaming its stdout into the binary file out.
+
+    The prompt goes in on stdin rather than argv, so long iteration
+    histories can't hit the OS argument-length limit.
+
+    Returns (returncode, stderr), keeping the last STDERR_TAIL bytes of
+    stderr. Raises FileNotFoundError or subprocess.TimeoutExpired like
+    subprocess.run, and _Interrupted if shutdown_jobs stopped it.
+    """
+    proc = subprocess.Popen(
+        ["claude", "--print", "--dangerously-skip-permissions"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=str(cfg.vault_root),
+    )
+    # Only the tail of stderr is kept, however chatty the CLI gets
+    stderr = bytearray()
+    pipes = [
+        threading.Thread(target=_feed, args=(proc.stdin, prompt.encode()), daemon=True),
+        threading.Thread(target=_pump, args=(proc.stdout, out), daemon=True),
+        threading.Thread(
+            target=_tail, args=(proc.stderr, stderr, STDERR_TAIL), daemon=True
+        ),
+    ]
+    for t in pipes:
+        t.start()
+    with _PROCS_LOCK:
+        _PROCS.add(proc)
+        if _STOPPING.is_set():
+            proc.kill()
+    deadline = time.monotonic() + cfg.timeout
+    try:
+        proc.wait(timeout=cfg.timeout)
+        # Background processes Claude started can hold the pipes open after it exits
+        for t in pipes:
+            t.join(max(0.0, deadline - time.monotonic()))
+        if any(t.is_alive() for t in pipes):
+            raise subprocess.TimeoutExpired(proc.args, cfg.timeout)
+    except BaseException as e:
+        # Timeout or interrupt: don't leave claude running, like subprocess.run
+        proc.kill()
+        proc.wait()
+        if isinstance(e, subprocess.TimeoutExpired) and _STOPPING.is_set():
+            raise _Interrupted from e
+        raise
+    finally:
+        with _PROCS_LOCK:
+            _PROCS.discard(proc)
+    if proc.returncode != 0 and _STOPPING.is_set():
+        raise _Interrupted
+    proc.stdout.close()
+    proc.stderr.close()
+    return proc.returncode, stderr.decode(errors="replace")
+
+
+# Rendered static preamble (system prompt + identity + path boundaries),
+# keyed on everything it depends on, including system-prompt.md's mtime.
+_PROMPT_CACHE: dict[tuple, str] = {}
+
+
+def _prompt_preamble(cfg: FamiliarConfig) -> str:
     system_prompt = cfg.vault_path / "system-prompt.md"
-    if system_prompt.exists():
+    try:
+        mtime = os.stat(system_prompt).st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+    key = (system_prompt, mtime, cfg.name, cfg.vault_root, tuple(cfg.allowed_paths))
+    cached = _PROMPT_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    parts = []
+    if mtime is not None:
         parts.append(system_prompt.read_text().strip())
 
     # Build path boundary instructions
@@ -131,6 +428,15 @@ def build_prompt(cfg: FamiliarConfig, meta: dict, body: str) -> str:
         "Do not read, write, or execute anything outside these paths."
     )
 
+    preamble = "\n\n".join(parts)
+    _PROMPT_CACHE.clear()
+    _PROMPT_CACHE[key] = preamble
+    return preamble
+
+
+def build_prompt(cfg: FamiliarConfig, meta: dict, body: str) -> str:
+    parts = [_prompt_preamble(cfg)]
+
     iteration = meta.get("iteration", 1)
     if iteration > 1:
         parts.append(
@@ -144,13 +450,13 @@ def build_prompt(cfg: FamiliarConfig, meta: dict, body: str) -> str:
 
 def process_file(filepath: Path, cfg: FamiliarConfig) -> None:
     name = filepath.name
-    processing = cfg.vault_path / "Processing" / name
     done_dir = cfg.vault_path / "Done"
     failed_dir = cfg.vault_path / "Failed"
 
-    # Atomic move to Processing
+    # Atomic move to Processing, under a suffixed name if a job with the
+    # same name is already in flight
     try:
-        shutil.move(str(filepath), str(processing))
+        processing = _move_unique(filepath, cfg.vault_path / "Processing" / name)
     except FileNotFoundError:
         log(cfg.name, f"Skipped {name} (already picked up)")
         return
@@ -169,74 +475,138 @@ def process_file(filepath: Path, cfg: FamiliarConfig) -> None:
     iteration = meta.get("iteration", 0) + 1
     meta["iteration"] = iteration
     meta["status"] = "processing"
-    meta["last_run"] = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+    started = datetime.now()
+    meta["last_run"] = started.strftime("%Y-%m-%dT%H:%M:%S")
 
-    # Write in-progress marker so it's visible in Obsidian
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M")
+    # In-progress marker so it's visible in Obsidian. Only written if the job
+    # outlasts cfg.marker_delay; fast jobs get a single write of the result.
+    ts = started.strftime("%Y-%m-%d %H:%M")
     processing_marker = f"\n\n> [!info] {cfg.name} — Working on report {iteration}...\n> Started at {ts}\n"
-    processing.write_text(serialize_frontmatter(meta, body + processing_marker))
+    marker_text = serialize_frontmatter(meta, body + processing_marker)
 
     # Build prompt
     prompt = build_prompt(cfg, meta, body)
 
-    # Call Claude CLI
-    try:
-        with Spinner(cfg.name, f"Working on {name}"):
-            result = subprocess.run(
-                ["claude", "--print", "--dangerously-skip-permissions", prompt],
-                capture_output=True,
-                text=True,
-                timeout=cfg.timeout,
-                cwd=str(cfg.vault_root),
+    # Call Claude CLI, streaming its output to a temp file
+    with tempfile.TemporaryFile() as out:
+        try:
+            with (
+                Spinner(cfg.name, f"Working on {name}"),
+                _delayed_write(cfg.marker_delay, processing, marker_text),
+            ):
+                returncode, stderr = _run_claude(cfg, prompt, out)
+        except _Interrupted:
+            # Not the job's fault: put it back untouched so it reruns on restart
+            _write_text(processing, content)
+            _move_unique(processing, cfg.vault_path / "Jobs" / name)
+            log(cfg.name, f"Interrupted: {name} — returned to Jobs/")
+            return
+        except FileNotFoundError:
+            error_msg = (
+                "Error: Claude CLI not found. "
+                "Install with: npm install -g @anthropic-ai/claude-code"
             )
-    except FileNotFoundError:
-        error_msg = (
-            "Error: Claude CLI not found. "
-            "Install with: npm install -g @anthropic-ai/claude-code"
+            log(cfg.name, f"Failed: {name} — claude CLI not found")
+            meta["status"] = "failed"
+            finished = datetime.now()
+            meta["last_run"] = finished.strftime("%Y-%m-%dT%H:%M:%S")
+            run_block = _run_block(cfg.name, iteration, error_msg, finished)
+            _write_text(processing, serialize_frontmatter(meta, body + run_block))
+            _move_unique(processing, failed_dir / name)
+            return
+        except subprocess.TimeoutExpired:
+            error_msg = f"Error: Claude CLI timed out after {cfg.timeout} seconds."
+            log(cfg.name, f"Failed: {name} — timeout")
+            meta["status"] = "failed"
+            finished = datetime.now()
+            meta["last_run"] = finished.strftime("%Y-%m-%dT%H:%M:%S")
+            run_block = _run_block(cfg.name, iteration, error_msg, finished)
+            _write_text(processing, serialize_frontmatter(meta, body + run_block))
+            _move_unique(processing, failed_dir / name)
+            return
+
+        if returncode != 0:
+            error_msg = f"Error: Claude CLI exited with code {returncode}.\n\n```\n{stderr.strip()}\n```"
+            log(cfg.name, f"Failed: {name} — exit code {returncode}")
+            meta["status"] = "failed"
+            finished = datetime.now()
+            meta["last_run"] = finished.strftime("%Y-%m-%dT%H:%M:%S")
+            run_block = _run_block(cfg.name, iteration, error_msg, finished)
+            _write_text(processing, serialize_frontmatter(meta, body + run_block))
+            _move_unique(processing, failed_dir / name)
+            return
+
+        # Success
+        meta["status"] = "done"
+        finished = datetime.now()
+        meta["last_run"] = finished.strftime("%Y-%m-%dT%H:%M:%S")
+        out.seek(0)
+        with _atomic_open(processing) as f:
+            f.write(serialize_frontmatter(meta, body))
+            _write_run_block(f, cfg.name, iteration, io.TextIOWrapper(out), finished)
+    dest = _move_unique(processing, done_dir / name)
+    log(cfg.name, f"Done: {name} → {dest.name}")
+
+
+# Shared worker pool, sized by cfg.max_parallel on first use
+_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+def _run_job(filepath: Path, cfg: FamiliarConfig) -> None:
+    """Run one job, logging unexpected errors so they can't take down sibling jobs."""
+    try:
+        process_file(filepath, cfg)
+    except Exception as e:
+        log(cfg.name, f"Failed: {filepath.name} — {e}")
+
+
+def submit_job(filepath: Path, cfg: FamiliarConfig) -> Future:
+    """Queue a job. Up to cfg.max_parallel jobs run at once.
+
+    Once shutdown_jobs has run, returns an already-cancelled future instead.
+    """
+    global _EXECUTOR
+    if _STOPPING.is_set():
+        future = Future()
+        future.cancel()
+        return future
+    if _EXECUTOR is None:
+        _EXECUTOR = ThreadPoolExecutor(
+            max_workers=cfg.max_parallel, thread_name_prefix="familiar"
         )
-        log(cfg.name, f"Failed: {name} — claude CLI not found")
-        meta["status"] = "failed"
-        meta["last_run"] = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
-        run_block = _run_block(cfg.name, iteration, error_msg)
-        processing.write_text(serialize_frontmatter(meta, body + run_block))
-        dest = unique_dest(failed_dir / name)
-        shutil.move(str(processing), str(dest))
-        return
-    except subprocess.TimeoutExpired:
-        error_msg = f"Error: Claude CLI timed out after {cfg.timeout} seconds."
-        log(cfg.name, f"Failed: {name} — timeout")
-        meta["status"] = "failed"
-        meta["last_run"] = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
-        run_block = _run_block(cfg.name, iteration, error_msg)
-        processing.write_text(serialize_frontmatter(meta, body + run_block))
-        dest = unique_dest(failed_dir / name)
-        shutil.move(str(processing), str(dest))
-        return
+    return _EXECUTOR.submit(_run_job, filepath, cfg)
 
-    if result.returncode != 0:
-        error_msg = f"Error: Claude CLI exited with code {result.returncode}.\n\n```\n{result.stderr.strip()}\n```"
-        log(cfg.name, f"Failed: {name} — exit code {result.returncode}")
-        meta["status"] = "failed"
-        meta["last_run"] = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
-        run_block = _run_block(cfg.name, iteration, error_msg)
-        processing.write_text(serialize_frontmatter(meta, body + run_block))
-        dest = unique_dest(failed_dir / name)
-        shutil.move(str(processing), str(dest))
-        return
 
-    # Success
-    output = result.stdout.strip()
-    meta["status"] = "done"
-    meta["last_run"] = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
-    run_block = _run_block(cfg.name, iteration, output)
-    processing.write_text(serialize_frontmatter(meta, body + run_block))
-    dest = unique_dest(done_dir / name)
-    shutil.move(str(processing), str(dest))
-    log(cfg.name, f"Done: {name} → {dest.name}")
+def shutdown_jobs() -> None:
+    """Cancel queued jobs and kill the Claude CLI of any job still running.
 
+    Interrupted jobs are restored and moved back to Jobs/ for the next run.
+    """
+    if _EXECUTOR is not None:
+        _EXECUTOR.shutdown(wait=False, cancel_futures=True)
+    with _PROCS_LOCK:
+        _STOPPING.set()
+        for proc in _PROCS:
+            proc.kill()
 
-def drain_jobs(cfg: FamiliarConfig) -> None:
-    """Process any .md files already sitting in Jobs/."""
+
+def queue_jobs(cfg: FamiliarConfig) -> list[Future]:
+    """Queue every .md file currently sitting in Jobs/, in name order."""
     jobs = cfg.vault_path / "Jobs"
-    for f in sorted(jobs.glob("*.md")):
-        process_file(f, cfg)
+    # is_file() answers from the directory listing's d_type, no stat needed
+    with os.scandir(jobs) as it:
+        entries = [
+            e for e in it if e.name.endswith(".md") and e.is_file(follow_symlinks=False)
+        ]
+    entries.sort(key=lambda e: e.name)
+    return [submit_job(Path(e.path), cfg) for e in entries]
+
+
+def drain_jobs(cfg: FamiliarConfig) -> None:
+    """Process any .md files already sitting in Jobs/ and wait for them."""
+    try:
+        wait(queue_jobs(cfg))
+    except BaseException:
+        # Ctrl-C: stop the backlog rather than letting the pool run it out
+        shutdown_jobs()
+        raise
@@ -1,33 +1,164 @@
-"""File watcher: polling for new jobs."""
+"""File watchers: native filesystem events, with polling fallback."""
 
+import os
+import shutil
 import signal
+import subprocess
 import sys
 import time
+from pathlib import Path
 
 from .config import POLL_INTERVAL, SETTLE_DELAY, FamiliarConfig
-from .dispatcher import log, process_file
+from .dispatcher import log, queue_jobs, shutdown_jobs, submit_job
 
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # optional dependency: pip install familiar[watch]
+    FileSystemEventHandler = object
+    Observer = None
 
-def watch(cfg: FamiliarConfig) -> None:
+class _JobHandler(FileSystemEventHandler):
+    """Dispatch .md files created in (or moved into) Jobs/."""
+
+    def __init__(self, cfg: FamiliarConfig):
+        super().__init__()
+        self.cfg = cfg
+
+    def on_created(self, event):
+        if not event.is_directory:
+            _dispatch(event.src_path, self.cfg)
+
+    def on_moved(self, event):
+        # Renames within Jobs/ (e.g. an editor's atomic save) land on dest_path
+        if not event.is_directory:
+            _dispatch(event.dest_path, self.cfg)
+
+
+def _dispatch(path: str, cfg: FamiliarConfig) -> None:
+    """Process a reported path if it's a .md file still sitting in Jobs/."""
+    if not path.endswith(".md"):
+        return
+    # Some backends report where a file moved to, including our own move
+    # into Processing/
+    if Path(path).parent != cfg.vault_path / "Jobs":
+        return
+    time.sleep(SETTLE_DELAY)
+    f = Path(path)
+    if f.exists():
+        submit_job(f, cfg)
+
+
+def watch(cfg: FamiliarConfig, poll: bool = False) -> None:
+    """Watch Jobs/ for new .md files, using native events when available.
+
+    Preference order: watchdog, then fswatch, then polling.
+    """
+    if poll:
+        watch_poll(cfg)
+    elif Observer is not None:
+        watch_events(cfg)
+    elif shutil.which("fswatch"):
+        watch_fswatch(cfg)
+    else:
+        log(cfg.name, "Neither watchdog nor fswatch found — falling back to polling")
+        watch_poll(cfg)
+
+
+def watch_events(cfg: FamiliarConfig) -> None:
+    """Watch Jobs/ via watchdog (inotify, FSEvents, ReadDirectoryChangesW)."""
+    jobs = cfg.vault_path / "Jobs"
+    observer = Observer()
+    observer.schedule(_JobHandler(cfg), str(jobs), recursive=False)
+
+    def cleanup(sig, frame):
+        log(cfg.name, "Shutting down")
+        # Stop the observer first so no event still settling can submit a job
+        observer.stop()
+        observer.join()
+        shutdown_jobs()
+        sys.exit(0)
+
+    signal.signal(signal.SIGINT, cleanup)
+    signal.signal(signal.SIGTERM, cleanup)
+
+    observer.start()
+    log(cfg.name, f"Watching {jobs} (native events)")
+    # Pick up anything dropped in while the startup backlog was draining;
+    # the observer only reports files created after it started
+    queue_jobs(cfg)
+    while True:
+        signal.pause()
+
+
+def watch_fswatch(cfg: FamiliarConfig) -> None:
+    """Watch Jobs/ via fswatch. Falls back to polling if fswatch exits."""
+    jobs = cfg.vault_path / "Jobs"
+    proc = subprocess.Popen(
+        [
+            "fswatch", "-0",
+            "--event", "Created", "--event", "MovedTo", "--event", "Renamed",
+            str(jobs),
+        ],
+        stdout=subprocess.PIPE,
+    )
+
+    def cleanup(sig, frame):
+        log(cfg.name, "Shutting down")
+        proc.terminate()
+        shutdown_jobs()
+        sys.exit(0)
+
+    signal.signal(signal.SIGINT, cleanup)
+    signal.signal(signal.SIGTERM, cleanup)
+
+    log(cfg.name, f"Watching {jobs} (fswatch)")
+    # Pick up anything dropped in while the startup backlog was draining;
+    # fswatch only reports files created after it started
+    queue_jobs(cfg)
+    # Paths arrive NUL-separated; a read may end mid-path, so keep the tail
+    fd = proc.stdout.fileno()
+    buf = bytearray()
+    while data := os.read(fd, 65536):
+        buf += data
+        while (idx := buf.find(0)) != -1:
+            path = os.fsdecode(bytes(buf[:idx]))
+            del buf[: idx + 1]
+            _dispatch(path, cfg)
+
+    proc.wait()
+    log(cfg.name, f"fswatch exited (code {proc.returncode}) — falling back to polling")
+    watch_poll(cfg)
+
+
+def watch_poll(cfg: FamiliarConfig) -> None:
     """Watch Jobs/ for new .md files using polling."""
     jobs = cfg.vault_path / "Jobs"
     log(cfg.name, f"Watching {jobs} (interval={POLL_INTERVAL}s)")
 
     def cleanup(sig, frame):
         log(cfg.name, "Shutting down")
+        shutdown_jobs()
         sys.exit(0)
 
     signal.signal(signal.SIGINT, cleanup)
     signal.signal(signal.SIGTERM, cleanup)
 
+    # Picked-up jobs are moved out of Jobs/, so any name missing from the
+    # previous listing is a new job. scandir gives names and d_type without
+    # a per-file stat, and no timestamps are compared, so clock skew on
+    # network filesystems doesn't matter.
     seen: set[str] = set()
     while True:
-        current = {f.name for f in jobs.glob("*.md")}
-        new = current - seen
-        for name in sorted(new):
+        with os.scandir(jobs) as entries:
+            current = {
+                e.name for e in entries
+                if e.name.endswith(".md") and e.is_file(follow_symlinks=False)
+            }
+        for name in sorted(current - seen):
             time.sleep(SETTLE_DELAY)
             f = jobs / name
             if f.exists():
-                process_file(f, cfg)
-        seen = {f.name for f in jobs.glob("*.md")}
+                submit_job(f, cfg)
+        seen = current
         time.sleep(POLL_INTERVAL)